@@ -1,5 +1,6 @@
 import os
 import time
+import uuid
 import threading
 import sqlite3
 from typing import Callable, Dict, Any, List, Annotated
@@ -12,7 +13,6 @@ from langchain_core.messages import (
     HumanMessage,
     SystemMessage,
     AIMessage,
-    ToolMessage,
     RemoveMessage,
 )
 from langgraph.graph import StateGraph, START, END
@@ -24,6 +24,13 @@ from langgraph.checkpoint.sqlite import SqliteSaver
 from characters.character import ST_IDLE, ST_RUN, ST_RUSH, ST_DAMAGE, ST_DIE
 from config import config, CONFIG_DIR
 from memory import memory
+from chat_log import chat_log
+
+
+# How many chat entries are sent per history page
+HISTORY_PAGE_SIZE = 20
+
+USER_PROMPT = "User said: '{}'. How do you respond?"
 
 
 class State(TypedDict):
@@ -54,7 +61,17 @@ class LLMBrain:
         self.thread_id = "wildrose_user"
         self.config = {"configurable": {"thread_id": self.thread_id}}
 
-        self.seen_message_ids = set()
+        # Resume cursor: seq of the newest chat log entry the client has.
+        # Seeded from the log head so a fresh brain (e.g. after a reconnect)
+        # does not replay old messages; resume() moves it to wherever the
+        # client actually is.
+        # Guarded by cursor_lock: the worker thread and the resume handler
+        # both move it.
+        self.cursor_lock = threading.Lock()
+        try:
+            self.cursor = chat_log.head()
+        except Exception:
+            self.cursor = None
 
         # Message queue to never drop user inputs if AI is currently thinking
         self.message_queue = []
@@ -159,7 +176,8 @@ class LLMBrain:
                 if keep_from == len(clean_messages):
                     keep_from = len(clean_messages) - 2
 
-                # Add truncated old messages to the removal list
+                # Add truncated old messages to the removal list.
+                # The full conversation is kept in the chat log for history.
                 to_remove.extend(
                     [RemoveMessage(id=m.id) for m in clean_messages[:keep_from]]
                 )
@@ -250,69 +268,52 @@ Guidelines:
 4. You don't have to always 'say' something. Sometimes just purring or moving is enough.
 """
 
-    def process_user_message(self, message: str):
-        self.message_queue.append(f"User said: '{message}'. How do you respond?")
+    def process_user_message(self, message: str, client_id: str | None = None):
+        # Tag the prompt with what the user typed so history can show it verbatim,
+        # and with the client's id for it so a resume does not render it twice
+        self.message_queue.append(
+            HumanMessage(
+                content=USER_PROMPT.format(message),
+                additional_kwargs={"display_text": message, "client_id": client_id},
+            )
+        )
         self._pump_queue()
 
     def _pump_queue(self):
         if self.is_thinking or not self.message_queue:
             return
 
-        prompt = self.message_queue.pop(0)
-        self._make_llm_decision(prompt)
+        message = self.message_queue.pop(0)
+        self._make_llm_decision(message)
 
-    def _make_llm_decision(self, context: str | None = None):
+    def _make_llm_decision(self, context: str | HumanMessage | None = None):
         if self.is_thinking:
             return
         self.is_thinking = True
 
-        prompt = context or "*You are feeling bored. What do you do?*"
+        message = context or "*You are feeling bored. What do you do?*"
+        if isinstance(message, str):
+            message = HumanMessage(content=message)
 
         if self.chat:
             self.chat.set_typing(True)
 
-        threading.Thread(target=self._llm_worker, args=(prompt,), daemon=True).start()
+        threading.Thread(target=self._llm_worker, args=(message,), daemon=True).start()
 
-    def _llm_worker(self, prompt: str):
+    def _llm_worker(self, message: HumanMessage):
         try:
             # We ONLY send the HumanMessage.
             # The system prompt is dynamically injected by the call_model node.
-            inputs = {"messages": [HumanMessage(content=prompt)]}
+            # Give it a known id so this turn can be found in the result.
+            message.id = message.id or str(uuid.uuid4())
+            inputs = {"messages": [message]}
 
             res = self.graph.invoke(inputs, self.config)
 
             if self.chat:
                 self.chat.set_typing(False)
 
-            # Extract ALL new messages that we haven't seen before
-            for msg in res["messages"]:
-                if msg.id not in self.seen_message_ids:
-                    self.seen_message_ids.add(msg.id)
-                    if isinstance(msg, AIMessage) and msg.content:
-                        # Do not display intermediate thought messages if they are just executing a tool
-                        if not hasattr(msg, "tool_calls") or not msg.tool_calls:
-                            # Content can sometimes be a list of blocks (Gemini/Claude format)
-                            # e.g. [{"type": "text", "text": "Hello"}]
-                            content_text = ""
-                            if isinstance(msg.content, str):
-                                content_text = msg.content
-                            elif isinstance(msg.content, list):
-                                parts = []
-                                for block in msg.content:
-                                    if isinstance(block, dict) and "text" in block:
-                                        parts.append(block["text"])
-                                    elif isinstance(block, str):
-                                        parts.append(block)
-                                content_text = " ".join(parts)
-                            else:
-                                content_text = str(msg.content)
-
-                            if self.chat and content_text.strip():
-                                self.chat.add_message(content_text, "eve")
-                    elif isinstance(msg, ToolMessage):
-                        # Tool execution results
-                        pass
-
+            self._sync_history(message, res["messages"])
         except Exception as e:
             if self.chat:
                 self.chat.set_typing(False)
@@ -328,6 +329,126 @@ Guidelines:
             if self.message_queue:
                 self._pump_queue()
 
+    # ---- History ----
+    @staticmethod
+    def _message_text(msg: BaseMessage) -> str:
+        # Content can sometimes be a list of blocks (Gemini/Claude format)
+        # e.g. [{"type": "text", "text": "Hello"}]
+        if isinstance(msg.content, str):
+            return msg.content
+        if isinstance(msg.content, list):
+            parts = []
+            for block in msg.content:
+                if isinstance(block, dict) and "text" in block:
+                    parts.append(block["text"])
+                elif isinstance(block, str):
+                    parts.append(block)
+            return " ".join(parts)
+        return str(msg.content)
+
+    def _to_chat_entry(self, msg: BaseMessage) -> Dict[str, Any] | None:
+        """Map a graph message to its chat log entry, or None if it is hidden."""
+        if isinstance(msg, AIMessage):
+            if getattr(msg, "tool_calls", None):
+                return None
+            text = self._message_text(msg)
+            if not text.strip():
+                return None
+            return {"id": msg.id, "text": text, "sender": "eve"}
+        if isinstance(msg, HumanMessage):
+            # Only real user input is tagged, not the internal proactive prompts
+            display_text = msg.additional_kwargs.get("display_text")
+            if display_text is not None:
+                return {
+                    "id": msg.id,
+                    "text": display_text,
+                    "sender": "user",
+                    "client_id": msg.additional_kwargs.get("client_id"),
+                }
+        return None
+
+    def _log_turn(self, message: HumanMessage, messages: List[BaseMessage]):
+        """Append this turn's visible messages to the chat log."""
+        ids = [m.id for m in messages]
+        # The state is trimmed, so only look past our own input when it is there
+        start = ids.index(message.id) + 1 if message.id in ids else 0
+        entries = []
+        for msg in [message] + messages[start:]:
+            entry = self._to_chat_entry(msg)
+            if entry:
+                entries.append(entry)
+        chat_log.append(entries)
+
+    def _sync_history(self, message: HumanMessage, messages: List[BaseMessage]):
+        """Log a finished turn and push the client everything after its cursor.
+
+        Kept apart from the LLM call so a history failure is not reported as
+        an LLM error. Working from the cursor also picks up turns that
+        finished after it was seeded, e.g. a reply from a previous
+        connection's brain, in log order.
+        """
+        try:
+            self._log_turn(message, messages)
+            delta = self._advance_cursor()
+        except Exception:
+            if self.chat:
+                self.chat.send_history_error()
+            return
+        if self.chat:
+            self.chat.send_history(delta)
+
+    def get_history_delta(
+        self, last_seq: int | None, limit: int = HISTORY_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """Chat entries the client has not seen since `last_seq`.
+
+        If `last_seq` is unknown (fresh page, or not in the log), the latest
+        page is returned with `reset` set so the client starts over.
+        """
+        if last_seq is None or not chat_log.has(last_seq):
+            entries, has_more = chat_log.latest(limit)
+            return {
+                "messages": entries,
+                "cursor": entries[-1]["seq"] if entries else None,
+                "reset": True,
+                "has_more": has_more,
+            }
+
+        entries = chat_log.after(last_seq)
+        return {
+            "messages": entries,
+            "cursor": entries[-1]["seq"] if entries else last_seq,
+            "reset": False,
+        }
+
+    def resume(self, last_seq: int | None) -> Dict[str, Any]:
+        """Delta since the client's `last_seq`, moving the cursor to the log head."""
+        with self.cursor_lock:
+            return self._delta_from(last_seq)
+
+    def _advance_cursor(self) -> Dict[str, Any]:
+        with self.cursor_lock:
+            return self._delta_from(self.cursor)
+
+    def _delta_from(self, last_seq: int | None) -> Dict[str, Any]:
+        # Caller holds cursor_lock. On failure the cursor is cleared, so the
+        # next delta is a full reset and the client cannot skip past entries
+        # it never received.
+        try:
+            delta = self.get_history_delta(last_seq)
+        except Exception:
+            self.cursor = None
+            raise
+        self.cursor = delta["cursor"]
+        return delta
+
+    def get_history_before(
+        self, before_seq: int, limit: int = HISTORY_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """One page of older chat entries preceding `before_seq`."""
+        entries, has_more = chat_log.before(before_seq, limit)
+        return {"messages": entries, "has_more": has_more}
+
     def update(self):
         current_time = time.time()
         time_since_decision = current_time - self.last_decision
@@ -0,0 +1,82 @@
+import sqlite3
+import threading
+from config import CHAT_LOG_FILE, CONFIG_DIR
+
+
+class ChatLog:
+    """Append-only log of what the chat shows, keyed by a monotonic `seq`.
+
+    The LangGraph thread is trimmed to a short context window, so the full
+    conversation lives here instead and history reads are indexed range
+    queries rather than a scan of the checkpointed state.
+    """
+
+    def __init__(self):
+        self._ensure_dir()
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(CHAT_LOG_FILE), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self.conn:
+            self.conn.execute(
+                """CREATE TABLE IF NOT EXISTS chat_log (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    msg_id TEXT UNIQUE,
+                    sender TEXT NOT NULL,
+                    text TEXT NOT NULL,
+                    client_id TEXT
+                )"""
+            )
+
+    def _ensure_dir(self):
+        if not CONFIG_DIR.exists():
+            CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+
+    def _query(self, sql: str, params=()) -> list[dict]:
+        with self.lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def append(self, entries: list[dict]):
+        # Messages already logged (same msg_id) are skipped
+        with self.lock, self.conn:
+            self.conn.executemany(
+                """INSERT OR IGNORE INTO chat_log (msg_id, sender, text, client_id)
+                VALUES (:id, :sender, :text, :client_id)""",
+                [{"client_id": None, **entry} for entry in entries],
+            )
+
+    def head(self) -> int | None:
+        with self.lock:
+            return self.conn.execute("SELECT MAX(seq) FROM chat_log").fetchone()[0]
+
+    def has(self, seq: int) -> bool:
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT 1 FROM chat_log WHERE seq = ?", (seq,)
+            ).fetchone()
+        return row is not None
+
+    def after(self, seq: int) -> list[dict]:
+        return self._query("SELECT * FROM chat_log WHERE seq > ? ORDER BY seq", (seq,))
+
+    def latest(self, limit: int) -> tuple[list[dict], bool]:
+        rows = self._query(
+            "SELECT * FROM chat_log ORDER BY seq DESC LIMIT ?", (limit + 1,)
+        )
+        return self._page(rows, limit)
+
+    def before(self, seq: int, limit: int) -> tuple[list[dict], bool]:
+        rows = self._query(
+            "SELECT * FROM chat_log WHERE seq < ? ORDER BY seq DESC LIMIT ?",
+            (seq, limit + 1),
+        )
+        return self._page(rows, limit)
+
+    @staticmethod
+    def _page(rows: list[dict], limit: int) -> tuple[list[dict], bool]:
+        # One extra row was fetched only to tell whether older entries exist
+        has_more = len(rows) > limit
+        return list(reversed(rows[:limit])), has_more
+
+
+chat_log = ChatLog()
@@ -6,6 +6,7 @@ from pathlib import Path
 CONFIG_DIR = Path.home() / ".wildrose"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 MEMORY_FILE = CONFIG_DIR / "memory.json"
+CHAT_LOG_FILE = CONFIG_DIR / "chat_log.sqlite"
 
 DEFAULT_CONFIG = {
     "llm_provider": "gemini",
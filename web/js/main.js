@@ -28,48 +28,197 @@ chatInput.addEventListener('input', function() {
 
 // WebSocket Connection
 const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-const ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
+let ws = null;
+let reconnectDelay = 500;
+let connectionLost = false;
+let pendingReconnectNotice = false;
 
-ws.onopen = () => {
-    console.log('Connected to AI server');
-};
+// Resume state: newest chat log seq we have rendered, oldest one for paging back
+let lastSeq = null;
+let oldestSeq = null;
+let hasMoreHistory = false;
+let loadingHistory = false;
 
-ws.onmessage = (event) => {
-    const data = JSON.parse(event.data);
-    
-    if (data.type === 'chat') {
-        appendMessage(data.text, data.sender);
-    } else if (data.type === 'typing') {
-        if (data.state) {
-            typingIndicator.classList.remove('hidden');
-            scrollToBottom();
-        } else {
-            typingIndicator.classList.add('hidden');
+// Bumped on every reset so a page requested before it is discarded
+let historyGeneration = 0;
+let pageRequestGeneration = 0;
+
+// Log entries already on screen, so repeated frames are idempotent
+const renderedSeqs = new Set();
+// Ids of user lines rendered locally on send, so history does not repeat them
+const renderedClientIds = new Set();
+
+function newClientId() {
+    if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+    return `${Date.now()}-${Math.random().toString(16).slice(2)}`;
+}
+
+function connect() {
+    ws = new WebSocket(`${protocol}//${window.location.host}/ws`);
+
+    ws.onopen = () => {
+        console.log('Connected to AI server');
+        reconnectDelay = 500;
+        if (connectionLost) {
+            // Shown once the resume reply has been applied, so a reset keeps it
+            pendingReconnectNotice = true;
+            connectionLost = false;
         }
-    } else if (data.type === 'action') {
-        setCatAction(data.action);
-    } else if (data.type === 'sound') {
-        if (data.sound === 'purr') {
-            sfxPurr.currentTime = 0;
-            sfxPurr.play();
-        } else if (data.sound === 'meow') {
-            sfxMeow.currentTime = 0;
-            sfxMeow.play();
+        // Ask only for what we missed since the last message we rendered
+        ws.send(JSON.stringify({ type: 'resume', last_seq: lastSeq }));
+    };
+
+    ws.onmessage = (event) => {
+        const data = JSON.parse(event.data);
+
+        if (data.type === 'chat') {
+            appendMessage(data.text, data.sender);
+        } else if (data.type === 'history') {
+            applyHistory(data);
+        } else if (data.type === 'history_page') {
+            prependHistory(data);
+        } else if (data.type === 'history_error') {
+            // Keep whatever is on screen; the server drops its cursor, so the
+            // next history frame is a reset that fills any gap
+            loadingHistory = false;
+            appendMessage("Could not load chat history.", "error");
+            showReconnectNotice();
+        } else if (data.type === 'typing') {
+            if (data.state) {
+                typingIndicator.classList.remove('hidden');
+                scrollToBottom();
+            } else {
+                typingIndicator.classList.add('hidden');
+            }
+        } else if (data.type === 'action') {
+            setCatAction(data.action);
+        } else if (data.type === 'sound') {
+            if (data.sound === 'purr') {
+                sfxPurr.currentTime = 0;
+                sfxPurr.play();
+            } else if (data.sound === 'meow') {
+                sfxMeow.currentTime = 0;
+                sfxMeow.play();
+            }
+        }
+    };
+
+    ws.onclose = () => {
+        if (!connectionLost) {
+            appendMessage("Connection lost. Reconnecting...", "error");
+            connectionLost = true;
         }
+        loadingHistory = false;
+        setTimeout(connect, reconnectDelay);
+        reconnectDelay = Math.min(reconnectDelay * 2, 10000);
+    };
+}
+
+function applyHistory(data) {
+    let pending = [];
+    if (data.reset) {
+        // Drop the conversation but keep system/error notices, and keep local
+        // user lines that are not in the log yet (sent mid-turn)
+        const pageClientIds = new Set(data.messages.map(m => m.client_id).filter(Boolean));
+        chatHistory.querySelectorAll('.msg-user, .msg-eve').forEach(el => {
+            const clientId = el.dataset.clientId;
+            if (clientId && !el.dataset.seq && !pageClientIds.has(clientId)) {
+                pending.push(el);
+            } else if (clientId) {
+                renderedClientIds.delete(clientId);
+            }
+            el.remove();
+        });
+        renderedSeqs.clear();
+        historyGeneration++;
+        oldestSeq = data.messages.length ? data.messages[0].seq : null;
+        hasMoreHistory = data.has_more;
+        lastSeq = data.cursor;
+    } else if (data.cursor !== null && (lastSeq === null || data.cursor > lastSeq)) {
+        lastSeq = data.cursor;
+    }
+    data.messages.forEach(m => {
+        const div = renderEntry(m);
+        if (div) appendElement(div);
+    });
+    pending.forEach(appendElement);
+    showReconnectNotice();
+    if (data.reset) loadOlderIfUnfilled();
+}
+
+// Element for a log entry, or null if it is already on screen
+function renderEntry(m) {
+    if (renderedSeqs.has(m.seq)) return null;
+    renderedSeqs.add(m.seq);
+    if (m.client_id && renderedClientIds.has(m.client_id)) {
+        const local = chatHistory.querySelector(`[data-client-id="${m.client_id}"]`);
+        if (local) local.dataset.seq = m.seq;
+        return null;
+    }
+    const div = createMessage(m.text, m.sender);
+    div.dataset.seq = m.seq;
+    return div;
+}
+
+function showReconnectNotice() {
+    if (!pendingReconnectNotice) return;
+    pendingReconnectNotice = false;
+    appendMessage("Reconnected.", "system");
+}
+
+function prependHistory(data) {
+    loadingHistory = false;
+    if (pageRequestGeneration !== historyGeneration) {
+        // Requested before a reset; its anchor no longer matches the panel
+        loadOlderIfUnfilled();
+        return;
     }
-};
+    hasMoreHistory = data.has_more;
+    if (!data.messages.length) return;
+
+    // Keep the viewport anchored on what the user was reading
+    const previousHeight = chatHistory.scrollHeight;
+    const fragment = document.createDocumentFragment();
+    data.messages.forEach(m => {
+        const div = renderEntry(m);
+        if (div) fragment.appendChild(div);
+    });
+    chatHistory.insertBefore(fragment, chatHistory.firstChild);
+    chatHistory.scrollTop = chatHistory.scrollHeight - previousHeight;
+    oldestSeq = data.messages[0].seq;
+    loadOlderIfUnfilled();
+}
+
+function requestOlderHistory() {
+    if (!hasMoreHistory || loadingHistory || !oldestSeq) return;
+    if (!ws || ws.readyState !== WebSocket.OPEN) return;
+    loadingHistory = true;
+    pageRequestGeneration = historyGeneration;
+    ws.send(JSON.stringify({ type: 'history', before_seq: oldestSeq }));
+}
 
-ws.onclose = () => {
-    appendMessage("Connection lost. Please refresh.", "error");
-};
+// A panel that does not scroll never fires 'scroll', so keep paging until it does
+function loadOlderIfUnfilled() {
+    if (chatHistory.scrollHeight <= chatHistory.clientHeight) requestOlderHistory();
+}
+
+// Page in older history when scrolled to the top
+chatHistory.addEventListener('scroll', () => {
+    if (chatHistory.scrollTop > 0) return;
+    requestOlderHistory();
+});
+
+connect();
 
 chatInput.addEventListener('keydown', (e) => {
     if (e.key === 'Enter' && !e.shiftKey) {
         e.preventDefault();
         const text = chatInput.value.trim();
-        if (text) {
-            appendMessage(text, "user");
-            ws.send(JSON.stringify({ type: 'chat', text: text }));
+        if (text && ws && ws.readyState === WebSocket.OPEN) {
+            const clientId = newClientId();
+            renderedClientIds.add(clientId);
+            appendMessage(text, "user").dataset.clientId = clientId;
+            ws.send(JSON.stringify({ type: 'chat', text: text, client_id: clientId }));
             chatInput.value = '';
             chatInput.style.height = 'auto';
         }
@@ -77,6 +226,16 @@ chatInput.addEventListener('keydown', (e) => {
 });
 
 function appendMessage(text, sender) {
+    return appendElement(createMessage(text, sender));
+}
+
+function appendElement(div) {
+    chatHistory.appendChild(div);
+    scrollToBottom();
+    return div;
+}
+
+function createMessage(text, sender) {
     const div = document.createElement('div');
     div.className = `message msg-${sender}`;
     
@@ -98,9 +257,8 @@ function appendMessage(text, sender) {
     const textNode = document.createTextNode(text);
     div.appendChild(textNode);
     div.innerHTML = div.innerHTML.replace(/\n/g, '<br>');
-    
-    chatHistory.appendChild(div);
-    scrollToBottom();
+
+    return div;
 }
 
 function scrollToBottom() {
@@ -116,7 +274,7 @@ function setCatAction(actionId) {
 // Interactive clicking on game area
 const gameArea = document.getElementById('game-area');
 gameArea.addEventListener('mousedown', () => {
-    ws.send(JSON.stringify({ type: 'pet' }));
+    if (ws && ws.readyState === WebSocket.OPEN) ws.send(JSON.stringify({ type: 'pet' }));
     setCatAction(3); // damage/pet animation locally for instant feedback
 });
 gameArea.addEventListener('mouseup', () => {
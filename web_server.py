@@ -41,6 +41,22 @@ class WebChatBridge:
         except Exception:
             pass
 
+    def send_history(self, delta: dict):
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self.ws.send_json({"type": "history", **delta}), self.loop
+            )
+        except Exception:
+            pass
+
+    def send_history_error(self):
+        try:
+            asyncio.run_coroutine_threadsafe(
+                self.ws.send_json({"type": "history_error"}), self.loop
+            )
+        except Exception:
+            pass
+
     def remove_last_message(self):
         pass
 
@@ -111,9 +127,30 @@ async def websocket_endpoint(websocket: WebSocket):
             data = await websocket.receive_text()
             payload = json.loads(data)
 
-            if payload.get("type") == "chat":
+            if payload.get("type") == "resume":
+                # Reply with only what the client missed, in one frame
+                try:
+                    delta = await asyncio.to_thread(
+                        brain.resume, payload.get("last_seq")
+                    )
+                except Exception:
+                    # A failed read must not look like an empty thread
+                    await websocket.send_json({"type": "history_error"})
+                else:
+                    await websocket.send_json({"type": "history", **delta})
+            elif payload.get("type") == "history":
+                # Older page requested while scrolling back
+                try:
+                    page = await asyncio.to_thread(
+                        brain.get_history_before, payload.get("before_seq")
+                    )
+                except Exception:
+                    await websocket.send_json({"type": "history_error"})
+                else:
+                    await websocket.send_json({"type": "history_page", **page})
+            elif payload.get("type") == "chat":
                 msg = payload.get("text")
-                brain.process_user_message(msg)
+                brain.process_user_message(msg, payload.get("client_id"))
             elif payload.get("type") == "pet":
                 # Handle petting interaction
                 char_bridge.set_action(ST_DAMAGE)